@@ -1,6 +1,10 @@
 import os
 import json
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from concurrent.futures import ProcessPoolExecutor
 
 class DataAnalysis:
     """
@@ -28,19 +32,27 @@ class DataAnalysis:
     def get_files(self, directory):
         """Retrieves files from a directory and returns a set of filenames (without extensions)."""
         try:
-            return {os.path.splitext(f)[0] for f in os.listdir(directory) if f.startswith(self.identifier) and f.endswith('.csv')}
+            with os.scandir(directory) as entries:
+                return {entry.name[:-8] for entry in entries
+                        if entry.name.startswith(self.identifier) and entry.name.endswith('.parquet') and entry.is_file()}
         except Exception as e:
             print(f"[ERROR] Failed to retrieve files from {directory}: {e}")
             return set()
 
-    def load_matching_data(self):
+    def load_matching_data(self, engineered_frames=None):
         """
         Loads matching engineered and forecasted datasets based on their filenames.
 
+        Args:
+            engineered_frames (dict, optional): Engineered DataFrames already held in memory, keyed by
+                filename. These are used instead of re-reading the matching engineered files.
+
         Returns:
             dict: A dictionary containing matched datasets, keyed by filename.
         """
-        engineered_files = self.get_files(self.engineered_directory)
+        engineered_frames = engineered_frames or {}
+
+        engineered_files = self.get_files(self.engineered_directory) | engineered_frames.keys()
         forecast_files = self.get_files(self.forecast_directory)
 
         matched_files = engineered_files.intersection(forecast_files)
@@ -52,8 +64,10 @@ class DataAnalysis:
         datasets = {}
         for filename in matched_files:
             try:
-                engineered_df = pd.read_csv(os.path.join(self.engineered_directory, f"{filename}.csv"))
-                forecast_df = pd.read_csv(os.path.join(self.forecast_directory, f"{filename}.csv"))
+                engineered_df = engineered_frames.get(filename)
+                if engineered_df is None:
+                    engineered_df = pd.read_parquet(os.path.join(self.engineered_directory, f"{filename}.parquet"), memory_map=True)
+                forecast_df = pd.read_parquet(os.path.join(self.forecast_directory, f"{filename}.parquet"), memory_map=True)
                 datasets[filename] = (engineered_df, forecast_df)
             except Exception as e:
                 print(f"[ERROR] Failed to load data for {filename}: {e}")
@@ -64,27 +78,63 @@ class DataAnalysis:
         """Checks if the analysis JSON file already exists."""
         return os.path.exists(os.path.join(self.analysis_directory, f"{filename}.json"))
 
-    def process(self):
+    def process(self, engineered_frames=None):
         """
         Runs the entire analysis workflow: loading, merging, analyzing, and saving results.
+
+        Args:
+            engineered_frames (dict, optional): Engineered DataFrames already held in memory, keyed by
+                filename (e.g. `FeatureEngineer.results`), to skip reading them back from disk.
         """
-        datasets = self.load_matching_data()
+        datasets = self.load_matching_data(engineered_frames)
 
         if not datasets:
             print("[INFO] No valid datasets available for analysis.")
             return
 
-        for filename, (engineered_df, forecast_df) in datasets.items():
+        self.process_dataframes(datasets)
+
+    def process_dataframes(self, named_pairs):
+        """
+        Merges, analyzes, and saves datasets that are already loaded in memory.
+
+        Args:
+            named_pairs (dict): (engineered_df, forecast_df) tuples keyed by filename.
+        """
+        pending = []
+        for filename, (engineered_df, forecast_df) in named_pairs.items():
             if self.already_processed(filename):
                 print(f"[INFO] Skipping {filename} (already processed).")
                 continue  # Skip processing if the file exists
+            pending.append((filename, engineered_df, forecast_df))
+
+        if not pending:
+            return
+
+        # A single dataset is analyzed inline, without pickling it and self over to a worker
+        if len(pending) == 1:
+            self.process_dataset(*pending[0])
+            return
 
-            merged_df = self.merge_data(engineered_df, forecast_df)
-            if merged_df is not None:
-                analysis_results = self.analyze_data(merged_df)
-                self.save_analysis(filename, merged_df, analysis_results)
-            else:
-                print(f"[INFO] Skipping analysis for {filename} due to merging issues.")
+        # Each dataset is analyzed independently, so run them in parallel worker processes
+        with ProcessPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1)) as executor:
+            list(executor.map(self.process_dataset, *zip(*pending)))
+
+    def process_dataset(self, filename, engineered_df, forecast_df):
+        """
+        Merges, analyzes, and saves a single pair of engineered and forecasted datasets.
+
+        Args:
+            filename (str): Base filename shared by both datasets.
+            engineered_df (pd.DataFrame): Engineered dataset with timestamps.
+            forecast_df (pd.DataFrame): Forecasted dataset; timestamps are generated if it has none.
+        """
+        merged_df = self.merge_data(engineered_df, forecast_df)
+        if merged_df is not None:
+            analysis_results = self.analyze_data(merged_df)
+            self.save_analysis(filename, merged_df, analysis_results)
+        else:
+            print(f"[INFO] Skipping analysis for {filename} due to merging issues.")
 
     def save_analysis(self, filename, merged_df, analysis_results):
         """
@@ -99,8 +149,8 @@ class DataAnalysis:
         analysis_file_path = os.path.join(self.analysis_directory, f"{filename}.json")
 
         try:
-            # Save merged data as CSV
-            merged_df.to_csv(merged_file_path, index=False)
+            # Save merged data as CSV with Arrow's multithreaded writer
+            pa_csv.write_csv(pa.Table.from_pandas(merged_df, preserve_index=False), merged_file_path)
             print(f"[INFO] Merged data saved to: {merged_file_path}")
 
             # Save analysis results as JSON
@@ -116,7 +166,7 @@ class DataAnalysis:
         Merges engineered data with forecasted data, ensuring proper timestamp alignment.
         Args:
             engineered_df (pd.DataFrame): Engineered dataset with timestamps.
-            forecast_df (pd.DataFrame): Forecasted dataset without timestamps.
+            forecast_df (pd.DataFrame): Forecasted dataset; timestamps are generated if it has none.
 
         Returns:
             pd.DataFrame: Merged dataset with aligned timestamps.
@@ -128,22 +178,28 @@ class DataAnalysis:
         # Ensure timestamps remain as integers
         engineered_df['timestamp'] = engineered_df['timestamp'].astype(int)
 
-        # Calculate average interval between timestamps
-        time_diff = engineered_df['timestamp'].diff().dropna().mean()
-
-        if pd.isnull(time_diff):
-            print("[ERROR] Unable to determine timestamp interval.")
-            return None
-
-        # Generate new timestamps for forecast data while maintaining millisecond format
-        last_timestamp = engineered_df['timestamp'].iloc[-1]
-        forecast_timestamps = [int(last_timestamp + (time_diff * i)) for i in range(1, len(forecast_df) + 1)]
-
-        # Assign generated timestamps to forecast data
-        forecast_df.insert(0, 'timestamp', forecast_timestamps)
-
-        # Merge datasets by concatenation
-        merged_df = pd.concat([engineered_df, forecast_df], axis=0).reset_index(drop=True)
+        # Forecasts fitted on resampled bars carry their own timestamps; older forecasts continue the engineered interval
+        if 'timestamp' not in forecast_df.columns:
+            # Average interval between timestamps; the differences telescope to (last - first) / (n - 1)
+            timestamps = engineered_df['timestamp'].to_numpy()
+            if len(timestamps) < 2:
+                print("[ERROR] Unable to determine timestamp interval.")
+                return None
+            time_diff = (timestamps[-1] - timestamps[0]) / (len(timestamps) - 1)
+
+            # Generate new timestamps for forecast data in integer milliseconds, avoiding float rounding drift
+            step = int(round(time_diff))
+            forecast_timestamps = np.int64(timestamps[-1]) + step * np.arange(1, len(forecast_df) + 1, dtype=np.int64)
+
+            # Assign generated timestamps to forecast data
+            forecast_df.insert(0, 'timestamp', forecast_timestamps)
+
+        # Merge datasets by concatenating each column once, padding columns missing on either side with NaN
+        columns = list(engineered_df.columns) + [col for col in forecast_df.columns if col not in engineered_df.columns]
+        engineered_df = engineered_df.reindex(columns=columns)
+        forecast_df = forecast_df.reindex(columns=columns)
+        merged_df = pd.DataFrame({col: np.concatenate([engineered_df[col].to_numpy(), forecast_df[col].to_numpy()])
+                                  for col in columns})
 
         return merged_df
     
@@ -167,8 +223,13 @@ class DataAnalysis:
         else:
             analysis_results['trend'] = "Unknown"
 
-        analysis_results['support'] = merged_df['price'].min() if 'price' in merged_df.columns else None
-        analysis_results['resistance'] = merged_df['price'].max() if 'price' in merged_df.columns else None
+        if 'price' in merged_df.columns:
+            price = merged_df['price'].to_numpy()
+            analysis_results['support'] = np.nanmin(price)
+            analysis_results['resistance'] = np.nanmax(price)
+        else:
+            analysis_results['support'] = None
+            analysis_results['resistance'] = None
 
         if analysis_results['trend'] == "Uptrend":
             analysis_results['recommendation'] = "Buy"
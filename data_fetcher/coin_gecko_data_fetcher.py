@@ -1,27 +1,118 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson serializes the chart payloads several times faster than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class RateLimiter:
+    """
+    Spaces out calls so that consecutive calls start at least `interval` seconds apart.
+    """
+
+    def __init__(self, interval):
+        """
+        Initializes the RateLimiter.
+
+        Args:
+            interval (float): Minimum time (in seconds) between two calls.
+        """
+        self.interval = interval
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """
+        Blocks until the next call slot is available and reserves it.
+        """
+        with self.lock:
+            delay = self.next_slot - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self.next_slot = time.monotonic() + self.interval
+
 
 class DataFetcher:
     """
     A class to interact with the CoinGecko API and fetch cryptocurrency data.
     """
 
-    def __init__(self, data_dir='./data/raw'):
+    def __init__(self, data_dir='./data/raw', etag_file='./data/etags.json'):
         """
         Initializes the DataFetcher instance.
 
         Args:
             data_dir (str): Directory where fetched data will be saved.
+            etag_file (str): File where response ETags are cached between runs.
         """
         self.base_url = "https://api.coingecko.com/api/v3"
         self.vs_currencies = "usd"
         self.coin_ids = ["bitcoin", "ethereum", "ravencoin", "tron"]
         self.data_dir = data_dir
+        self.etag_file = etag_file
+
+        # A shared session keeps the connection to the API alive between requests, retrying
+        # rate-limited and failed requests with exponential backoff
+        self.session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+        self.session.headers.update({"Accept-Encoding": "gzip"})
+        self.timeout = (5, 30)  # (connect, read) seconds
+        self.etags = self.load_etags()
+        self.etag_lock = threading.Lock()
 
         os.makedirs(data_dir, exist_ok=True)
 
+    def load_etags(self):
+        """
+        Loads the cached response ETags from disk.
+
+        Returns:
+            dict: ETags keyed by request URL and parameters.
+        """
+        try:
+            with open(self.etag_file, 'r') as file:
+                return json.load(file)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def save_etag(self, key, etag):
+        """
+        Caches the ETag of a response and persists the cache to disk.
+
+        Args:
+            key (str): Cache key of the request.
+            etag (str): ETag returned by the API.
+        """
+        with self.etag_lock:
+            self.etags[key] = etag
+            try:
+                with open(self.etag_file, 'w') as file:
+                    json.dump(self.etags, file)
+            except (IOError, OSError) as e:
+                print(f"[ERROR] Unable to save ETags to {self.etag_file}: {e}")
+
+    def request_key(self, endpoint, params=None):
+        """
+        Builds the ETag cache key of a request.
+
+        Args:
+            endpoint (str): The API endpoint to query.
+            params (dict, optional): Query parameters.
+
+        Returns:
+            str: Request URL followed by its sorted parameters.
+        """
+        return self.base_url + endpoint + json.dumps(params or {}, sort_keys=True)
+
     def make_request(self, endpoint, params=None):
         """
         Sends a GET request to the specified API endpoint.
@@ -31,16 +122,41 @@ class DataFetcher:
             params (dict, optional): Query parameters.
 
         Returns:
-            dict: JSON response from the API, or None if an error occurs.
+            tuple: JSON response from the API (None if an error occurs or the data is unchanged)
+                and the ETag of the response (None if the API sent none).
         """
         url = self.base_url + endpoint
+        key = self.request_key(endpoint, params)
+        headers = {"If-None-Match": self.etags[key]} if key in self.etags else None
         try:
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+            if response.status_code == 304:
+                print(f"[INFO] Data from {url} unchanged since the last fetch.")
+                return None, None
             response.raise_for_status()
-            return response.json()
+            return response.json(), response.headers.get("ETag")
         except requests.exceptions.RequestException as e:
             print(f"[ERROR] Failed to fetch data from {url}: {e}")
-            return None
+            return None, None
+
+    def fetch_and_save(self, endpoint, filename, params=None):
+        """
+        Fetches an API endpoint and saves the response to a local JSON file.
+
+        Args:
+            endpoint (str): The API endpoint to query.
+            filename (str): Name of the file to save the data in.
+            params (dict, optional): Query parameters.
+
+        Returns:
+            dict: JSON response from the API, or None if an error occurs or the data is unchanged.
+        """
+        data, etag = self.make_request(endpoint, params)
+        # The ETag is only cached once the payload is on disk, otherwise a failed write would
+        # turn every later fetch into a 304 and the data would never be saved
+        if data and self.save_to_file(data, filename) and etag:
+            self.save_etag(self.request_key(endpoint, params), etag)
+        return data
 
     def save_to_file(self, data, filename):
         """
@@ -49,17 +165,30 @@ class DataFetcher:
         Args:
             data (dict): Data to save.
             filename (str): Name of the file to save the data in.
+
+        Returns:
+            bool: True if the data was saved, False otherwise.
         """
         identifier = "gecko"
         timestamp = time.strftime("%Y%m%d%H%M%S")
         full_path = os.path.join(self.data_dir, f"{identifier}_{timestamp}_{filename}")
 
+        # Written to a temporary file first so an interrupted write never leaves a torn JSON file behind
+        temp_path = f"{full_path}.tmp"
         try:
-            with open(full_path, 'w') as file:
-                json.dump(data, file, indent=4)
+            with open(temp_path, 'wb') as file:
+                if orjson is not None:
+                    file.write(orjson.dumps(data))
+                else:
+                    file.write(json.dumps(data, separators=(',', ':')).encode('utf-8'))
+            os.replace(temp_path, full_path)
             print(f"[INFO] Data successfully saved to: {full_path}")
+            return True
         except (IOError, OSError) as e:
             print(f"[ERROR] Unable to save data to {full_path}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
 
     def ping(self):
         """
@@ -69,9 +198,7 @@ class DataFetcher:
             dict: Response from the API.
         """
         print("[INFO] Pinging the API...")
-        data = self.make_request("/ping")
-        if data:
-            self.save_to_file(data, "ping.json")
+        data = self.fetch_and_save("/ping", "ping.json")
         return data
 
     def get_coins_list(self):
@@ -82,9 +209,7 @@ class DataFetcher:
             dict: JSON response containing the list of coins.
         """
         print("[INFO] Fetching the list of coins...")
-        data = self.make_request("/coins/list")
-        if data:
-            self.save_to_file(data, "coins_list.json")
+        data = self.fetch_and_save("/coins/list", "coins_list.json")
         return data
 
     def get_global_data(self):
@@ -95,9 +220,7 @@ class DataFetcher:
             dict: JSON response containing global market data.
         """
         print("[INFO] Fetching global cryptocurrency data...")
-        data = self.make_request("/global")
-        if data:
-            self.save_to_file(data, "global_data.json")
+        data = self.fetch_and_save("/global", "global_data.json")
         return data
 
     def get_coin_data_by_id(self, coin_id):
@@ -111,9 +234,7 @@ class DataFetcher:
             dict: JSON response for the specified cryptocurrency.
         """
         print(f"[INFO] Fetching data for coin: {coin_id}")
-        data = self.make_request(f"/coins/{coin_id}")
-        if data:
-            self.save_to_file(data, f"{coin_id}_data.json")
+        data = self.fetch_and_save(f"/coins/{coin_id}", f"{coin_id}_data.json")
         return data
 
     def get_coin_price_by_id(self, coin_id):
@@ -136,9 +257,7 @@ class DataFetcher:
             "include_last_updated_at": "true",
             "precision": 5
         }
-        data = self.make_request("/simple/price", params)
-        if data:
-            self.save_to_file(data, f"{coin_id}_price.json")
+        data = self.fetch_and_save("/simple/price", f"{coin_id}_price.json", params)
         return data
 
     def get_coin_chart(self, coin_id, days):
@@ -154,9 +273,7 @@ class DataFetcher:
         """
         print(f"[INFO] Fetching {days}-day chart data for coin: {coin_id}")
         params = {"vs_currency": self.vs_currencies, "days": days}
-        data = self.make_request(f"/coins/{coin_id}/market_chart", params)
-        if data:
-            self.save_to_file(data, f"{coin_id}_market_chart_{days}days.json")
+        data = self.fetch_and_save(f"/coins/{coin_id}/market_chart", f"{coin_id}_market_chart_{days}days.json", params)
         return data
 
     def get_coin_charts(self, coin_id):
@@ -167,8 +284,9 @@ class DataFetcher:
             coin_id (str): ID of the cryptocurrency.
         """
         print(f"[INFO] Fetching market charts for coin: {coin_id}")
-        self.get_coin_chart(coin_id, 365)
-        self.get_coin_chart(coin_id, 90)
+        # Both charts are independent, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(self.get_coin_chart, [coin_id, coin_id], [365, 90]))
         print(f"[INFO] Completed fetching market charts for coin: {coin_id}")
 
     def run_static_calls(self):
@@ -181,17 +299,23 @@ class DataFetcher:
         self.get_global_data()
         print("[INFO] Static API calls completed.")
 
-    def run_id_calls(self, delay=20):
+    def run_id_calls(self, delay=20, max_concurrent=2):
         """
-        Executes API calls for predefined coin IDs, with a delay between each.
+        Executes API calls for predefined coin IDs concurrently, spacing out the start of each coin.
 
         Args:
-            delay (int): Time to wait (in seconds) between API calls for each coin.
+            delay (int): Minimum time (in seconds) between the start of API calls for consecutive coins.
+            max_concurrent (int): Maximum number of coins fetched at the same time.
         """
         print("[INFO] Running ID-dependent API calls...")
-        for coin_id in self.coin_ids:
+        rate_limiter = RateLimiter(delay)
+
+        def fetch_charts(coin_id):
+            rate_limiter.wait()
             self.get_coin_charts(coin_id)
-            time.sleep(delay)
+
+        with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+            list(executor.map(fetch_charts, self.coin_ids))
         print("[INFO] ID-dependent API calls completed.")
 
 
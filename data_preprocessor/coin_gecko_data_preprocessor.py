@@ -1,11 +1,29 @@
 import os
-import json
-import csv
 import re
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# orjson parses the large numeric chart payloads several times faster than the stdlib
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Timestamp embedded in pipeline filenames, e.g. gecko_20240101000000_bitcoin_...
+_TS_RE = re.compile(r'_(\d+)_')
+
+
+def _timestamp_key(filename):
+    """Sort key returning the timestamp embedded in a filename, or 0 if there is none."""
+    match = _TS_RE.search(filename)
+    return int(match.group(1)) if match else 0
+
 
 class DataPreprocessor:
     """
-    A class to handle the processing of raw JSON data files and converting them into CSV format.
+    A class to handle the processing of raw JSON data files and converting them into Parquet format.
     """
 
     def __init__(self, raw_directory='./data/raw', processed_directory='./data/processed', identifier="gecko"):
@@ -14,7 +32,7 @@ class DataPreprocessor:
 
         Args:
             raw_directory (str): Directory containing raw JSON files.
-            processed_directory (str): Directory to store processed CSV files.
+            processed_directory (str): Directory to store processed Parquet files.
             identifier (str): Fixed identifier used in filenames.
         """
         self.raw_directory = raw_directory
@@ -23,24 +41,37 @@ class DataPreprocessor:
 
         os.makedirs(processed_directory, exist_ok=True)
 
-    def get_sorted_files(self, directory):
+    def list_files(self, directory):
         """
-        Retrieves all files in a directory, sorted by timestamp in the filename.
+        Retrieves all files in a directory, in no particular order.
 
         Args:
             directory (str): The directory to list files from.
 
         Returns:
-            list: A list of filenames sorted by timestamp.
+            list: A list of filenames.
         """
         try:
-            files = [f for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f))]
-            files.sort(key=lambda x: int(re.search(r'_(\d+)_', x).group(1)) if re.search(r'_(\d+)_', x) else 0)
-            return files
+            with os.scandir(directory) as entries:
+                return [entry.name for entry in entries if entry.is_file()]
         except Exception as e:
             print(f"[ERROR] Failed to retrieve files from {directory}: {e}")
             return []
 
+    def get_sorted_files(self, directory):
+        """
+        Retrieves all files in a directory, sorted by timestamp in the filename.
+
+        Args:
+            directory (str): The directory to list files from.
+
+        Returns:
+            list: A list of filenames sorted by timestamp.
+        """
+        files = self.list_files(directory)
+        files.sort(key=_timestamp_key)
+        return files
+
     def get_unprocessed_files(self, raw_files, processed_files):
         """
         Identifies files present in the raw directory but missing in the processed directory.
@@ -52,56 +83,52 @@ class DataPreprocessor:
         Returns:
             list: A list of filenames missing from the processed directory.
         """
-        processed_set = {f.replace('.csv', '.json') for f in processed_files if self.identifier in f}
-        unprocessed_files = [f for f in raw_files if f not in processed_set]
+        # Compare extension-less stems so no replacement string is built per file
+        processed_stems = {f[:-8] for f in processed_files if f.endswith('.parquet') and self.identifier in f}
+        unprocessed_files = [f for f in raw_files if f.endswith('.json') and f[:-5] not in processed_stems]
         return unprocessed_files
 
-    def convert_json_to_csv(self, raw_file_path, csv_file_path):
+    def convert_json_to_parquet(self, raw_file_path, parquet_file_path):
         """
-        Converts a JSON file containing prices, market caps, and total volumes into a CSV file.
+        Converts a JSON file containing prices, market caps, and total volumes into a Parquet file.
 
         Args:
             raw_file_path (str): Path to the JSON file.
-            csv_file_path (str): Path to the output CSV file.
+            parquet_file_path (str): Path to the output Parquet file.
         """
         try:
-            with open(raw_file_path, 'r') as json_file:
-                data = json.load(json_file)
+            with open(raw_file_path, 'rb') as json_file:
+                data = json_loads(json_file.read())
 
-            prices = data.get("prices", [])
-            market_caps = data.get("market_caps", [])
-            total_volumes = data.get("total_volumes", [])
+            # Each section is a list of [timestamp, value] pairs
+            sections = [data.get(key, []) for key in ("prices", "market_caps", "total_volumes")]
 
-            if not (len(prices) == len(market_caps) == len(total_volumes)):
+            if not (len(sections[0]) == len(sections[1]) == len(sections[2])):
                 raise ValueError("Mismatch in data lengths for prices, market_caps, and total_volumes.")
 
-            rows = [
-                {
-                    "timestamp": prices[i][0],
-                    "price": prices[i][1],
-                    "market_cap": market_caps[i][1],
-                    "volume": total_volumes[i][1]
-                } 
-                for i in range(len(prices))
-            ]
-
-            with open(csv_file_path, 'w', newline='') as csv_file:
-                fieldnames = ["timestamp", "price", "market_cap", "volume"]
-                writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(rows)
-
-            print(f"[INFO] Successfully converted {raw_file_path} to {csv_file_path}")
+            # Convert all three sections with a single call into a (3, rows, 2) array
+            values = np.asarray(sections, dtype=np.float64).reshape(3, -1, 2)
+
+            table = pa.table({
+                "timestamp": values[0, :, 0].astype(np.int64),
+                "price": values[0, :, 1],
+                "market_cap": values[1, :, 1],
+                "volume": values[2, :, 1]
+            })
+            pq.write_table(table, parquet_file_path, compression='zstd')
+
+            print(f"[INFO] Successfully converted {raw_file_path} to {parquet_file_path}")
         except Exception as e:
-            print(f"[ERROR] Failed to convert {raw_file_path} to CSV: {e}")
+            print(f"[ERROR] Failed to convert {raw_file_path} to Parquet: {e}")
 
     def process_raw(self):
         """
-        Processes all raw JSON files in the raw directory and converts them to CSV format.
+        Processes all raw JSON files in the raw directory and converts them to Parquet format.
         """
         print("[INFO] Starting processing of raw JSON files...")
         raw_files = self.get_sorted_files(self.raw_directory)
-        processed_files = self.get_sorted_files(self.processed_directory)
+        # Only checked for membership, so the output listing is not sorted
+        processed_files = self.list_files(self.processed_directory)
 
         unprocessed_files = self.get_unprocessed_files(raw_files, processed_files)
 
@@ -109,13 +136,18 @@ class DataPreprocessor:
             print("[INFO] No new files to process.")
             return
 
-        for raw_file in unprocessed_files:
-            raw_file_path = os.path.join(self.raw_directory, raw_file)
-            csv_file_name = raw_file.replace('.json', '.csv')
-            csv_file_path = os.path.join(self.processed_directory, csv_file_name)
-
-            print(f"[INFO] Processing file: {raw_file_path}")
-            self.convert_json_to_csv(raw_file_path, csv_file_path)
+        raw_directory, processed_directory = self.raw_directory, self.processed_directory
+        raw_file_paths = [f"{raw_directory}{os.sep}{raw_file}" for raw_file in unprocessed_files]
+        parquet_file_paths = [f"{processed_directory}{os.sep}{raw_file[:-5]}.parquet" for raw_file in unprocessed_files]
+
+        # Files are independent, so convert them in parallel worker processes; a lone file is
+        # converted in this process instead of paying for a worker start-up
+        print(f"[INFO] Processing {len(raw_file_paths)} file(s)...")
+        if len(raw_file_paths) == 1:
+            self.convert_json_to_parquet(raw_file_paths[0], parquet_file_paths[0])
+        else:
+            with ProcessPoolExecutor(max_workers=min(len(raw_file_paths), os.cpu_count() or 1)) as executor:
+                list(executor.map(self.convert_json_to_parquet, raw_file_paths, parquet_file_paths))
 
         print("[INFO] Processing completed for all files.")
 
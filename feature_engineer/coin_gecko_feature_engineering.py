@@ -1,46 +1,230 @@
 import os
-import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 import re
+from concurrent.futures import ProcessPoolExecutor
+from numba import njit
+
+# Columns written by the preprocessor
+_USECOLS = ['timestamp', 'price', 'market_cap', 'volume']
+
+# Timestamp embedded in pipeline filenames, e.g. gecko_20240101000000_bitcoin_...
+_TS_RE = re.compile(r'_(\d+)_')
+
+
+def _timestamp_key(filename):
+    """Sort key returning the timestamp embedded in a filename, or 0 if there is none."""
+    match = _TS_RE.search(filename)
+    return int(match.group(1)) if match else 0
+
+
+@njit(cache=True)
+def sma_multi(price, windows):
+    """
+    Computes several simple moving averages from a single prefix sum of the prices.
+
+    Matches pandas' `rolling(window).mean()`: a window that contains a missing price gives NaN,
+    and the averages recover once the window has moved past it.
+
+    Args:
+        price (np.ndarray): Price series as float64, sorted by timestamp.
+        windows (np.ndarray): Window lengths, one output column per window.
+
+    Returns:
+        np.ndarray: Array of shape (len(price), len(windows)), NaN until each window is full.
+    """
+    n = price.size
+    # Missing prices add nothing to the sum and are counted separately
+    prefix = np.zeros(n + 1)
+    missing = np.zeros(n + 1, dtype=np.int64)
+    for i in range(n):
+        if np.isnan(price[i]):
+            prefix[i + 1] = prefix[i]
+            missing[i + 1] = missing[i] + 1
+        else:
+            prefix[i + 1] = prefix[i] + price[i]
+            missing[i + 1] = missing[i]
+
+    out = np.full((n, windows.size), np.nan)
+    for j in range(windows.size):
+        w = windows[j]
+        for i in range(w - 1, n):
+            if missing[i + 1] == missing[i + 1 - w]:
+                out[i, j] = (prefix[i + 1] - prefix[i + 1 - w]) / w
+    return out
+
+
+@njit(cache=True)
+def ema_multi(price, spans):
+    """
+    Computes several exponential moving averages in one pass over the prices.
+
+    Matches pandas' `ewm(span=span, adjust=False).mean()`: each average starts at the first valid price,
+    and a missing price carries the average forward while its weight keeps decaying.
+
+    Args:
+        price (np.ndarray): Price series as float64, sorted by timestamp.
+        spans (np.ndarray): EMA spans, one output column per span.
+
+    Returns:
+        np.ndarray: Array of shape (len(price), len(spans)), NaN before the first valid price.
+    """
+    n = price.size
+    out = np.full((n, spans.size), np.nan)
+    alphas = 2.0 / (spans + 1.0)
+    ema = np.full(spans.size, np.nan)
+    # Weight of the running average relative to the next price, below 1 after missing prices
+    old_weights = np.ones(spans.size)
+    for i in range(n):
+        if np.isnan(price[i]):
+            if not np.isnan(ema[0]):
+                old_weights *= 1.0 - alphas
+        elif np.isnan(ema[0]):
+            ema[:] = price[i]
+        else:
+            for j in range(spans.size):
+                old_weight = old_weights[j] * (1.0 - alphas[j])
+                ema[j] = (old_weight * ema[j] + alphas[j] * price[i]) / (old_weight + alphas[j])
+                old_weights[j] = 1.0
+        out[i, :] = ema
+    return out
+
+
+@njit(cache=True)
+def rsi_wilder(price, period):
+    """
+    Computes the Relative Strength Index using Wilder's smoothing in a single pass.
+
+    The first average gain/loss is the simple mean of the first `period` price changes;
+    every later value is updated recursively, so the cost is O(N) regardless of `period`.
+    A change next to a missing price is missing too: it is left out of the averages instead
+    of counting as no change, which carry forward and decay as in pandas' `ewm(adjust=False)`.
+
+    Args:
+        price (np.ndarray): Price series as float64, sorted by timestamp.
+        period (int): Smoothing period of the RSI.
+
+    Returns:
+        np.ndarray: RSI values, NaN for the warm-up rows.
+    """
+    n = price.size
+    rsi = np.full(n, np.nan)
+    if n <= period:
+        return rsi
+
+    alpha = 1.0 / period
+    avg_gain = 0.0
+    avg_loss = 0.0
+    old_weight = 1.0
+    count = 0
+    for i in range(1, n):
+        delta = price[i] - price[i - 1]
+        if np.isnan(delta):
+            if count < period:
+                continue
+            old_weight *= 1.0 - alpha
+        else:
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+
+            if count < period:
+                count += 1
+                avg_gain += gain / period
+                avg_loss += loss / period
+                if count < period:
+                    continue
+            else:
+                weight = old_weight * (1.0 - alpha)
+                avg_gain = (weight * avg_gain + alpha * gain) / (weight + alpha)
+                avg_loss = (weight * avg_loss + alpha * loss) / (weight + alpha)
+                old_weight = 1.0
+
+        if avg_loss == 0.0:
+            rsi[i] = 100.0
+        else:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return rsi
+
+
+def warm_up_kernels():
+    """
+    Compiles the feature kernels for the argument types used by `FeatureEngineer`, or loads them from Numba's cache.
+
+    Long-running processes call this at startup so the first engineered file does not pay for the compilation.
+    """
+    writable = np.linspace(1.0, 2.0, 120)
+    # Zero-copy columns from Arrow are read-only arrays, which Numba compiles as a separate signature
+    read_only = writable.copy()
+    read_only.flags.writeable = False
+
+    for price in (read_only, writable):
+        sma_multi(price, np.array([5, 25, 100]))
+        ema_multi(price, np.array([9, 50]))
+        rsi_wilder(price, 12)
+
 
 class FeatureEngineer:
     """
-    A class for feature engineering of processed CSV data by adding Moving Averages, 
+    A class for feature engineering of processed Parquet data by adding Moving Averages, 
     Exponential Moving Averages, and RSI (Relative Strength Index) calculations.
     """
 
+    # Feature method for each timeframe, keyed by the last component of the filename
+    _HANDLERS = {
+        '365days': 'daily_features',
+        '90days': 'hourly_features'
+    }
+
     def __init__(self, preprocessed_directory='./data/processed', engineered_directory='./data/engineered', identifier="gecko"):
         """
         Initializes the FeatureEngineer instance.
 
         Args:
-            preprocessed_directory (str): Directory containing processed CSV files.
-            engineered_directory (str): Directory to store feature-engineered CSV files.
+            preprocessed_directory (str): Directory containing processed Parquet files.
+            engineered_directory (str): Directory to store feature-engineered Parquet files.
             identifier (str): Fixed identifier used in filenames.
         """
         self.identifier = identifier
         self.preprocessed_directory = preprocessed_directory
         self.engineered_directory = engineered_directory
 
+        # DataFrames engineered by the last engineer_features call, keyed by filename without extension
+        self.results = {}
+
         os.makedirs(engineered_directory, exist_ok=True)
 
-    def get_sorted_files(self, directory):
+    def list_files(self, directory):
         """
-        Retrieves all files in a directory, sorted by timestamp in the filename.
+        Retrieves all files in a directory, in no particular order.
 
         Args:
             directory (str): The directory to list files from.
 
         Returns:
-            list: A list of filenames sorted by timestamp.
+            list: A list of filenames.
         """
         try:
-            files = [f for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f))]
-            files.sort(key=lambda x: int(re.search(r'_(\d+)_', x).group(1)) if re.search(r'_(\d+)_', x) else 0)
-            return files
+            with os.scandir(directory) as entries:
+                return [entry.name for entry in entries if entry.is_file()]
         except Exception as e:
             print(f"[ERROR] Failed to retrieve files from {directory}: {e}")
             return []
 
+    def get_sorted_files(self, directory):
+        """
+        Retrieves all files in a directory, sorted by timestamp in the filename.
+
+        Args:
+            directory (str): The directory to list files from.
+
+        Returns:
+            list: A list of filenames sorted by timestamp.
+        """
+        files = self.list_files(directory)
+        files.sort(key=_timestamp_key)
+        return files
+
     def get_unengineered_files(self, processed_files, engineered_files):
         """
         Identifies files present in the processed directory but missing in the engineered directory.
@@ -56,74 +240,120 @@ class FeatureEngineer:
         unengineered_files = [f for f in processed_files if f not in engineered_set]
         return unengineered_files
 
-    def engineer_daily_dataset(self, file_path, output_directory):
+    def load_table(self, file_path):
         """
-        Adds 5-day, 25-day, and 100-day Moving Averages to a daily CSV dataset.
+        Reads the preprocessed columns of a Parquet file as an Arrow table sorted by timestamp.
 
         Args:
-            file_path (str): Path to the input CSV file.
-            output_directory (str): Directory to save the updated CSV file.
+            file_path (str): Path to the input Parquet file.
+
+        Returns:
+            pa.Table: Table with the timestamp, price, market cap and volume columns.
         """
-        try:
-            df = pd.read_csv(file_path)
-            df.sort_values(by='timestamp', inplace=True)
+        table = pq.read_table(file_path, columns=_USECOLS, memory_map=True)
 
-            # Add Moving Averages
-            df['5_day_MA'] = df['price'].rolling(window=5).mean()
-            df['25_day_MA'] = df['price'].rolling(window=25).mean()
-            df['100_day_MA'] = df['price'].rolling(window=100).mean()
+        # CoinGecko returns the points in order, so the sort is usually replaced by a monotonicity check
+        timestamps = table.column('timestamp').to_numpy()
+        if not (np.diff(timestamps) >= 0).all():
+            table = table.take(np.argsort(timestamps, kind='stable'))
+        return table
 
-            output_file_path = os.path.join(output_directory, os.path.basename(file_path))
-            df.to_csv(output_file_path, index=False)
-            print(f"[INFO] Successfully engineered daily features for {file_path} -> {output_file_path}")
-        except Exception as e:
-            print(f"[ERROR] Failed to engineer daily dataset for {file_path}: {e}")
+    def save_table(self, table, features, output_file_path):
+        """
+        Appends feature columns to an Arrow table and writes it to a Parquet file.
+
+        Args:
+            table (pa.Table): Table returned by `load_table`.
+            features (dict): Feature arrays keyed by column name, in output order.
+            output_file_path (str): Path of the engineered Parquet file.
+
+        Returns:
+            pd.DataFrame: The engineered data, for handing to later stages in memory.
+        """
+        for name, values in features.items():
+            table = table.append_column(name, pa.array(values))
+
+        pq.write_table(table, output_file_path, compression='zstd')
+        return table.to_pandas()
+
+    def daily_features(self, price):
+        """
+        Computes 5-day, 25-day, and 100-day Moving Averages for a daily dataset.
+
+        Args:
+            price (np.ndarray): Price series as float64, sorted by timestamp.
+
+        Returns:
+            dict: Feature arrays keyed by column name.
+        """
+        mas = sma_multi(price, np.array([5, 25, 100]))
+        return {'5_day_MA': mas[:, 0], '25_day_MA': mas[:, 1], '100_day_MA': mas[:, 2]}
+
+    def hourly_features(self, price):
+        """
+        Computes 9-hr and 50-hr Exponential Moving Averages and 12-hr RSI for an hourly dataset.
+
+        Args:
+            price (np.ndarray): Price series as float64, sorted by timestamp.
+
+        Returns:
+            dict: Feature arrays keyed by column name.
+        """
+        # Exponential Moving Averages
+        emas = ema_multi(price, np.array([9, 50]))
 
-    def engineer_hourly_dataset(self, file_path, output_directory):
+        # RSI with Wilder's smoothing
+        rsi = rsi_wilder(price, 12)
+
+        return {'9_hr_EMA': emas[:, 0], '50_hr_EMA': emas[:, 1], '12_hr_RSI': rsi}
+
+    def engineer_file(self, preprocessed_file):
         """
-        Adds 9-hr and 50-hr Exponential Moving Averages and 12-hr RSI to an hourly CSV dataset.
+        Applies the feature engineering that matches the timeframe of a single preprocessed file.
+
+        The file is read once, every matching feature set is computed from the same prices, and the result is written once.
 
         Args:
-            file_path (str): Path to the input CSV file.
-            output_directory (str): Directory to save the updated CSV file.
+            preprocessed_file (str): Name of the file in the preprocessed directory.
+
+        Returns:
+            pd.DataFrame or None: The engineered DataFrame, or None if the file was not engineered.
         """
+        last_component = preprocessed_file.split('_')[-1].lower()
+        methods = [method for timeframe, method in self._HANDLERS.items() if last_component.startswith(timeframe)]
+        if not methods:
+            return None
+
+        preprocessed_file_path = f"{self.preprocessed_directory}{os.sep}{preprocessed_file}"
+        output_file_path = f"{self.engineered_directory}{os.sep}{preprocessed_file}"
+
         try:
-            df = pd.read_csv(file_path)
-            df.sort_values(by='timestamp', inplace=True)
-
-            # Add Exponential Moving Averages
-            df['9_hr_EMA'] = df['price'].ewm(span=9, adjust=False).mean()
-            df['50_hr_EMA'] = df['price'].ewm(span=50, adjust=False).mean()
-
-            # Calculate RSI
-            df['price_change'] = df['price'].diff()
-            df['gain'] = df['price_change'].apply(lambda x: x if x > 0 else 0)
-            df['loss'] = df['price_change'].apply(lambda x: -x if x < 0 else 0)
-            df['avg_gain'] = df['gain'].rolling(window=12).mean()
-            df['avg_loss'] = df['loss'].rolling(window=12).mean()
-            df['rs'] = df['avg_gain'] / df['avg_loss']
-            df['12_hr_RSI'] = 100 - (100 / (1 + df['rs']))
-
-            # Clean up intermediate columns
-            df.drop(['price_change', 'gain', 'loss', 'avg_gain', 'avg_loss', 'rs'], axis=1, inplace=True)
-
-            # Save to output directory
-            output_file_path = os.path.join(output_directory, os.path.basename(file_path))
-            df.to_csv(output_file_path, index=False)
-            print(f"[INFO] Successfully engineered hourly features for {file_path} -> {output_file_path}")
+            table = self.load_table(preprocessed_file_path)
+            price = table.column('price').to_numpy().astype(np.float64, copy=False)
+
+            features = {}
+            for method in methods:
+                features.update(getattr(self, method)(price))
+
+            df = self.save_table(table, features, output_file_path)
+            print(f"[INFO] Successfully engineered features for {preprocessed_file_path} -> {output_file_path}")
+            return df
         except Exception as e:
-            print(f"[ERROR] Failed to engineer hourly dataset for {file_path}: {e}")
+            print(f"[ERROR] Failed to engineer dataset for {preprocessed_file_path}: {e}")
+            return None
 
     def engineer_features(self):
         """
-        Processes all CSV files in the preprocessed directory and applies feature engineering.
+        Processes all Parquet files in the preprocessed directory and applies feature engineering.
 
         Feature engineering logic is based on the last component of the filenames 
-        (e.g., "year" for daily dataset, "90days" for hourly dataset).
+        (e.g., "365days" for daily dataset, "90days" for hourly dataset), see `_HANDLERS`.
         """
         print("[INFO] Starting feature engineering...")
+        self.results = {}
         preprocessed_files = self.get_sorted_files(self.preprocessed_directory)
-        engineered_files = self.get_sorted_files(self.engineered_directory)
+        # Only checked for membership, so the output listing is not sorted
+        engineered_files = self.list_files(self.engineered_directory)
 
         unengineered_files = self.get_unengineered_files(preprocessed_files, engineered_files)
 
@@ -131,16 +361,18 @@ class FeatureEngineer:
             print("[INFO] No new files to engineer.")
             return
 
-        for preprocessed_file in unengineered_files:
-            preprocessed_file_path = os.path.join(self.preprocessed_directory, preprocessed_file)
-
-            last_component = preprocessed_file.split('_')[-1].lower()
-
-            if last_component.startswith("365days"):
-                self.engineer_daily_dataset(preprocessed_file_path, self.engineered_directory)
+        # Files are independent, so engineer them in parallel worker processes.
+        # A single file is engineered inline, where starting a worker would cost more than the work.
+        if len(unengineered_files) == 1:
+            engineered_dfs = [self.engineer_file(unengineered_files[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=min(len(unengineered_files), os.cpu_count() or 1)) as executor:
+                engineered_dfs = list(executor.map(self.engineer_file, unengineered_files))
 
-            elif last_component.startswith("90days"):
-                self.engineer_hourly_dataset(preprocessed_file_path, self.engineered_directory)
+        # Keep the results in memory so later stages can skip reading them back
+        for preprocessed_file, df in zip(unengineered_files, engineered_dfs):
+            if df is not None:
+                self.results[os.path.splitext(preprocessed_file)[0]] = df
 
         print("[INFO] Feature engineering completed for all files.")
 
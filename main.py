@@ -1,9 +1,17 @@
-import time
+import os
 import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Compiled Numba kernels are cached on disk so that restarts and worker processes load them instead of recompiling.
+# Set before the pipeline modules import Numba, which reads it at import time.
+os.environ.setdefault("NUMBA_CACHE_DIR", "./.numba_cache")
+
+import numpy as np
 from flask import Flask
-from data_fetcher.coin_gecko_data_fetcher import DataFetcher
+from statsforecast.models import AutoARIMA
+from data_fetcher.coin_gecko_data_fetcher import DataFetcher, RateLimiter
 from data_preprocessor.coin_gecko_data_preprocessor import DataPreprocessor
-from feature_engineer.coin_gecko_feature_engineering import FeatureEngineer
+from feature_engineer.coin_gecko_feature_engineering import FeatureEngineer, warm_up_kernels
 from model_generator.coin_gecko_model_generator import ModelGenerator
 from data_analyzer.coin_gecko_data_analyzer import DataAnalysis
 from visualizer.data_visualizer import *
@@ -19,41 +27,111 @@ data_analyzer = DataAnalysis()
 crypto_assets = ["bitcoin", "ethereum", "ravencoin"]
 
 # Customizable delays (in seconds)
-delay_between_assets = 5 * 60  # 5 minutes between assets
+delay_between_assets = 60  # Minimum spacing between API fetches of consecutive assets
 delay_between_cycles = 24 * 60 * 60  # 24 hours between full cycles
 
+# Rate limits the API fetches instead of sleeping after every asset
+fetch_rate_limiter = RateLimiter(delay_between_assets)
+
+# A single processing worker keeps the stages, which share the data directories, from racing.
+# Scheduled cycles and on-demand triggers both go through it.
+processing_pool = ThreadPoolExecutor(max_workers=1)
+# Runs on-demand fetches so that HTTP requests return without waiting on the rate limiter
+trigger_pool = ThreadPoolExecutor(max_workers=1)
+# Set to start the next full cycle early instead of waiting out delay_between_cycles
+cycle_requested = threading.Event()
+
+def fetch(asset):
+    """Fetches the market charts of an asset, respecting the API rate limit."""
+    fetch_rate_limiter.wait()
+    print(f"\n[INFO] Fetching cryptocurrency data for {asset}...\n")
+    data_fetcher.get_coin_charts(asset)
+
+def process(asset):
+    """Runs the offline stages of the workflow on the data fetched for an asset."""
+    print(f"[INFO] Preprocessing raw data for {asset}...")
+    preprocessor.process_raw()
+
+    print(f"[INFO] Performing feature engineering on {asset}...")
+    engineer.engineer_features()
+
+    print(f"[INFO] Generating forecasts for '365days' and '90days' timeframes for {asset}...")
+    model_generator.fit_timeframes(timeframes=('365days', '90days'), steps=30, frames=engineer.results)
+
+    print(f"[INFO] Analyzing data for {asset}...")
+    data_analyzer.process(engineer.results)
+
+    print(f"[INFO] Completed workflow for {asset}.")
+
+def warmup_models():
+    """Compiles the feature kernels and exercises the ARIMA backend so the first workflow cycle does not pay for it."""
+    print("[INFO] Warming up feature kernels and forecasting models...")
+    warm_up_kernels()
+
+    prices = np.linspace(1.0, 2.0, 120) + np.sin(np.arange(120))
+    exog = np.column_stack([prices ** 2, np.cos(np.arange(120))])
+    model = AutoARIMA(seasonal=False, stepwise=True, approximation=False)
+    model.fit(y=prices[:-5], X=exog[:-5])
+    model.predict(h=5, X=exog[-5:])
+    print("[INFO] Warm-up completed.")
+
+def log_failure(stage, asset):
+    """Returns a future callback that logs the exception of a failed stage run for an asset."""
+    def callback(future):
+        if not future.cancelled() and future.exception() is not None:
+            print(f"[ERROR] {stage} failed for {asset}: {future.exception()}")
+    return callback
+
+def run_asset(asset):
+    """Fetches an asset and queues its processing behind any stages already running."""
+    fetch(asset)
+    processing_pool.submit(process, asset).add_done_callback(log_failure("Processing", asset))
+
 def run_workflow():
     while True:
         print("\n[INFO] Starting new workflow cycle...\n")
+        cycle_requested.clear()
 
+        # Fetches stay sequential and rate limited; each asset is processed while the next one is fetched.
+        pending = []
         for asset in crypto_assets:
-            print(f"\n[INFO] Fetching cryptocurrency data for {asset}...\n")
-            data_fetcher.get_coin_charts(asset)
+            fetch(asset)
+            pending.append((asset, processing_pool.submit(process, asset)))
 
-            print(f"[INFO] Preprocessing raw data for {asset}...")
-            preprocessor.process_raw()
+        # A failed stage is reported here instead of being left unread on its future
+        for asset, future in pending:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"[ERROR] Processing failed for {asset}: {e}")
 
-            print(f"[INFO] Performing feature engineering on {asset}...")
-            engineer.engineer_features()
+        print(f"\n[INFO] Finished full cycle! Waiting {delay_between_cycles} seconds before restarting...\n")
+        # Sleeps without polling and wakes early when a new cycle is triggered over HTTP
+        cycle_requested.wait(timeout=delay_between_cycles)
 
-            print(f"[INFO] Generating forecast for '365days' timeframe for {asset}...")
-            model_generator.fit(timeframe='365days', steps=30)
+@app.route('/trigger', methods=["POST"])
+def trigger_cycle():
+    cycle_requested.set()
+    return jsonify({"status": "Workflow cycle triggered"}), 202
 
-            print(f"[INFO] Generating forecast for '90days' timeframe for {asset}...")
-            model_generator.fit(timeframe='90days', steps=30)
+@app.route('/trigger/<asset>', methods=["POST"])
+def trigger_asset(asset):
+    if asset not in crypto_assets:
+        return jsonify({"error": f"Unknown asset: {asset}"}), 404
 
-            print(f"[INFO] Analyzing data for {asset}...")
-            data_analyzer.process()
+    # Nobody waits on a triggered run, so its failures are logged when it finishes
+    trigger_pool.submit(run_asset, asset).add_done_callback(log_failure("Triggered fetch", asset))
+    return jsonify({"status": f"Workflow triggered for {asset}"}), 202
 
-            print(f"[INFO] Completed workflow for {asset}. Waiting {delay_between_assets} seconds before next asset...")
-            time.sleep(delay_between_assets)
-        
-        print(f"\n[INFO] Finished full cycle! Waiting {delay_between_cycles} seconds before restarting...\n")
-        time.sleep(delay_between_cycles)
+# Guarded so worker processes spawned by the pipeline stages do not re-run the app
+if __name__ == "__main__":
+    # Warm up before any stage forks worker processes: a worker forked while another thread holds
+    # Numba's compiler lock would hang on its first kernel call
+    warmup_models()
 
-# Start workflow in a separate thread
-workflow_thread = threading.Thread(target=run_workflow, daemon=True)
-workflow_thread.start()
+    # Start workflow in a separate thread
+    workflow_thread = threading.Thread(target=run_workflow, daemon=True)
+    workflow_thread.start()
 
-# Run Flask app indefinitely
-app.run()
+    # Run Flask app indefinitely
+    app.run()
@@ -1,25 +1,59 @@
 import os
 import re
+import math
+import json
+import shutil
+import hashlib
+from itertools import repeat
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
-from pmdarima import auto_arima
+import pyarrow as pa
+import pyarrow.parquet as pq
+from statsforecast.models import ARIMA, AutoARIMA
+
+# Timestamp embedded in pipeline filenames, e.g. gecko_20240101000000_bitcoin_...
+_TS_RE = re.compile(r'_(\d+)_')
+
 
 class ModelGenerator:
     """
     A class to generate predictive models and forecasts from engineered datasets using ARIMA.
     """
 
-    def __init__(self, dataset_directory='./data/engineered', forecast_directory='./data/forecast', identifier="gecko"):
+    # Exogenous regressors used for each timeframe
+    _EXOG = {
+        '365days': ('market_cap', 'volume', '5_day_MA', '25_day_MA', '100_day_MA'),
+        '90days': ('market_cap', 'volume', '9_hr_EMA', '50_hr_EMA', '12_hr_RSI')
+    }
+
+    # Bar size the training series is resampled to before fitting, or None to keep the native resolution.
+    # Hourly 90-day data is fitted on 4-hour bars, which cuts the series length, and the fit time, by 4x.
+    _RESAMPLE_RULES = {'365days': None, '90days': '4h'}
+
+    # Aggregation of each column into a resampled bar; other columns take the bar's last value
+    _RESAMPLE_AGG = {'market_cap': 'mean', 'volume': 'mean'}
+
+    # A stored model order is reused unless the residual RMSE over the most recent
+    # _DRIFT_WINDOW points exceeds _DRIFT_RMSE_RATIO times the in-sample RMSE
+    _DRIFT_WINDOW = 30
+    _DRIFT_RMSE_RATIO = 2.0
+
+    def __init__(self, dataset_directory='./data/engineered', forecast_directory='./data/forecast', model_directory='./data/models', identifier="gecko"):
         """
         Initializes the ModelGenerator.
 
         Args:
             dataset_directory (str): Directory containing feature-engineered datasets.
             forecast_directory (str): Directory to store forecast results.
+            model_directory (str): Directory to store the selected model orders.
             identifier (str): Fixed identifier used in filenames.
         """
         self.identifier = identifier
         self.dataset_directory = dataset_directory
         self.forecast_directory = forecast_directory
+        self.model_directory = model_directory
 
         # Internal attributes for tracking progress and storing data
         self.dataset_file_name = None
@@ -27,86 +61,295 @@ class ModelGenerator:
         self.data = None
         self.train = None
         self.train_exog = None
+        self.forecast_timestamps = None
         self.model = None
         self.forecast = None
         self.future_exog_data = None
 
         os.makedirs(self.forecast_directory, exist_ok=True)
+        os.makedirs(self.model_directory, exist_ok=True)
 
-    def get_sorted_files(self, directory):
+    def list_timestamped_files(self, directory, prefix, suffix):
         """
-        Retrieves all files in a directory, sorted by timestamp in the filename.
+        Retrieves the files in a directory matching a prefix and suffix, paired with their filename timestamp.
 
         Args:
             directory (str): The directory to list files from.
+            prefix (str): Required filename prefix.
+            suffix (str): Required filename suffix.
 
         Returns:
-            list: A list of filenames sorted by timestamp.
+            list: Unsorted (timestamp, filename) tuples; files without a timestamp are skipped.
         """
         try:
-            files = [f for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f))]
-            return sorted(files, key=lambda x: int(re.search(r'_(\d+)_', x).group(1)) if re.search(r'_(\d+)_', x) else 0)
+            with os.scandir(directory) as entries:
+                files = [entry.name for entry in entries if entry.is_file()]
         except Exception as e:
             print(f"[ERROR] Failed to retrieve files from {directory}: {e}")
             return []
 
-    def load_data(self, timeframe):
+        pairs = []
+        for f in files:
+            if f.startswith(prefix) and f.endswith(suffix) and (match := _TS_RE.search(f)):
+                pairs.append((int(match.group(1)), f))
+        return pairs
+
+    def load_data(self, timeframe, frames=None):
         """
-        Loads the latest dataset file that matches the timeframe and isn't already forecasted.
+        Loads the oldest dataset file that matches the timeframe and is newer than the latest forecast.
 
         Args:
             timeframe (str): The timeframe to filter files ('365days' or '90days').
+            frames (dict, optional): Engineered DataFrames already in memory, keyed by filename without extension.
+                A matching frame is used instead of reading the file back from disk.
 
         Returns:
-            pd.DataFrame or None: DataFrame of the loaded CSV file, or None if no new file is found.
+            pd.DataFrame or None: Timestamp, target and exogenous columns of the loaded Parquet file, or None if no new file is found.
         """
-        dataset_files = [f for f in self.get_sorted_files(self.dataset_directory) 
-                         if f.startswith(self.identifier) and f.endswith(f'{timeframe}.csv')]
-
-        forecast_files = [f for f in self.get_sorted_files(self.forecast_directory) 
-                          if f.startswith(self.identifier) and f.endswith(f'{timeframe}.csv')]
+        suffix = f'{timeframe}.parquet'
+        dataset_pairs = self.list_timestamped_files(self.dataset_directory, self.identifier, suffix)
+        forecast_pairs = self.list_timestamped_files(self.forecast_directory, self.identifier, suffix)
 
         # Find the latest forecast timestamp if available
-        latest_forecast_timestamp = max(
-            (int(re.search(r'_(\d+)_', f).group(1)) for f in forecast_files if re.search(r'_(\d+)_', f)),
-            default=None
-        )
-
-        # Load the latest dataset file that hasn't been forecasted
-        for dataset_file in dataset_files:
-            dataset_timestamp = int(re.search(r'_(\d+)_', dataset_file).group(1))
-            if latest_forecast_timestamp is None or dataset_timestamp > latest_forecast_timestamp:
-                self.dataset_file_name = dataset_file
-                return pd.read_csv(os.path.join(self.dataset_directory, dataset_file))
+        latest_forecast_timestamp = max((ts for ts, _ in forecast_pairs), default=-1)
+
+        # Load the oldest dataset file that hasn't been forecasted, in a single scan instead of a sort
+        candidate = min((pair for pair in dataset_pairs if pair[0] > latest_forecast_timestamp),
+                        default=None, key=itemgetter(0))
+        if candidate is not None:
+            self.dataset_file_name = candidate[1]
+            columns = ['timestamp', self.target, *self._EXOG.get(timeframe, ())]
+
+            frame = (frames or {}).get(os.path.splitext(self.dataset_file_name)[0])
+            if frame is not None:
+                return frame[columns]
+
+            # Only the target and the timeframe's regressors are read from the columnar file
+            return pd.read_parquet(os.path.join(self.dataset_directory, self.dataset_file_name), columns=columns, memory_map=True)
 
         print(f"[INFO] No new datasets available for timeframe: '{timeframe}'.")
         return None
 
-    def preprocess_data(self, exogenous_columns):
+    def preprocess_data(self, exogenous_columns, resample_rule=None, steps=30):
         """
         Preprocesses the loaded data by dropping missing values and extracting target and exogenous variables.
 
         Args:
-            exogenous_columns (list): List of column names to use as exogenous variables.
+            exogenous_columns (tuple): Column names to use as exogenous variables.
+            resample_rule (str, optional): Bar size to resample the series to (e.g. '4h'), see `_RESAMPLE_RULES`.
+            steps (int): Forecast horizon, in time steps of the loaded dataset.
+
+        Returns:
+            int or None: Forecast horizon in steps of the training series, covering at least the requested horizon,
+                or None if the dataset has too few rows to fit a model.
         """
-        self.data = self.data.dropna()
-        self.train = self.data[self.target]
-        self.train_exog = self.data[exogenous_columns]
+        # The forecast interval is derived from the timestamps, which needs at least two rows
+        if len(self.data) < 2:
+            print(f"[ERROR] Not enough data to fit a model on {self.dataset_file_name}: {len(self.data)} row(s).")
+            return None
+
+        columns = [self.target, *exogenous_columns]
+        timestamps = self.data['timestamp'].to_numpy(np.int64)
+        data = self.data[columns]
+
+        # Average interval between timestamps; the differences telescope to (last - first) / (n - 1)
+        step = int(round((timestamps[-1] - timestamps[0]) / max(len(timestamps) - 1, 1)))
+
+        if resample_rule:
+            # Bars are labelled with their right bin edge, which can lie after the last observation
+            data = data.set_index(pd.to_datetime(timestamps, unit='ms'))
+            aggregation = {col: self._RESAMPLE_AGG.get(col, 'last') for col in columns}
+            data = data.resample(resample_rule, closed='right', label='right').agg(aggregation)
+
+            # Keep the requested horizon in time: e.g. 30 hourly steps become 8 four-hour bars
+            bar_step = pd.Timedelta(resample_rule) // pd.Timedelta(milliseconds=1)
+            steps = max(1, math.ceil(steps * step / bar_step))
+            step = bar_step
+
+        # Forecasts continue from the last real observation at the training interval, in integer milliseconds
+        self.forecast_timestamps = np.int64(timestamps[-1]) + step * np.arange(1, steps + 1, dtype=np.int64)
+
+        # Built once in float64 and handed to statsforecast without further casts: its ARIMA routines
+        # upcast to float64 internally, and market caps need more than float32's ~7 significant digits.
+        # Rows with missing values (the moving-average warm-up, empty bars) are masked out in a single slice
+        values = data.to_numpy(np.float64)
+        values = values[~np.isnan(values).any(axis=1)]
+        self.train = values[:, 0]
+        self.train_exog = values[:, 1:]
+        return steps
+
+    def dataset_key(self):
+        """
+        Returns the loaded dataset's filename without its timestamp and extension, identifying its asset and timeframe.
+
+        Returns:
+            str: Key such as 'gecko_bitcoin_market_chart_365days'.
+        """
+        return _TS_RE.sub('_', os.path.splitext(self.dataset_file_name)[0], count=1)
+
+    def model_spec_path(self):
+        """
+        Returns the path of the stored model order for the loaded dataset's asset and timeframe.
+
+        Returns:
+            str: Path of the JSON file, named after the dataset file without its timestamp.
+        """
+        return os.path.join(self.model_directory, f"{self.dataset_key()}.json")
+
+    def fingerprint_path(self, timeframe):
+        """
+        Returns the path of the fingerprint cache of a timeframe.
+
+        Each timeframe has its own cache so that timeframes fitted in parallel never write the same file.
+
+        Args:
+            timeframe (str): Timeframe of the cache ('365days' or '90days').
+
+        Returns:
+            str: Path of the hidden JSON file in the forecast directory.
+        """
+        return os.path.join(self.forecast_directory, f".fingerprints_{timeframe}.json")
+
+    def load_fingerprints(self, timeframe):
+        """
+        Loads the fingerprints of the datasets last forecasted for a timeframe.
+
+        Args:
+            timeframe (str): Timeframe of the cache ('365days' or '90days').
+
+        Returns:
+            dict: Fingerprint and forecast filename keyed by `dataset_key`.
+        """
+        try:
+            with open(self.fingerprint_path(timeframe), 'r') as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def save_fingerprints(self, timeframe, fingerprints):
+        """
+        Persists the fingerprint cache of a timeframe.
+
+        Args:
+            timeframe (str): Timeframe of the cache ('365days' or '90days').
+            fingerprints (dict): Fingerprint and forecast filename keyed by `dataset_key`.
+        """
+        try:
+            with open(self.fingerprint_path(timeframe), 'w') as f:
+                json.dump(fingerprints, f)
+        except (IOError, OSError) as e:
+            print(f"[ERROR] Failed to save dataset fingerprints: {e}")
+
+    def data_fingerprint(self, steps):
+        """
+        Computes a BLAKE2b fingerprint of the loaded model columns and the forecast horizon.
+
+        Args:
+            steps (int): Number of future time steps to forecast.
+
+        Returns:
+            str: Hex digest that changes whenever the fit would see different inputs.
+        """
+        digest = hashlib.blake2b(str(steps).encode(), digest_size=16)
+        for column in self.data.columns:
+            digest.update(column.encode())
+            digest.update(np.ascontiguousarray(self.data[column].to_numpy()).tobytes())
+        return digest.hexdigest()
+
+    def reuse_forecast(self, forecast_file_name):
+        """
+        Copies a previous forecast to the loaded dataset's forecast file instead of fitting again.
+
+        Args:
+            forecast_file_name (str): Name of the forecast file made from identical data.
+
+        Returns:
+            str or None: Path of the new forecast file, or None if the previous forecast is unavailable.
+        """
+        source = os.path.join(self.forecast_directory, forecast_file_name)
+        destination = os.path.join(self.forecast_directory, self.dataset_file_name)
+        try:
+            shutil.copyfile(source, destination)
+            print(f"[INFO] Dataset unchanged since {forecast_file_name}, reused its forecast: {destination}")
+            return destination
+        except (IOError, OSError):
+            return None
+
+    def load_model_spec(self):
+        """
+        Loads the model order selected by the last full search for this asset and timeframe.
+
+        Returns:
+            dict or None: The stored model specification, or None if there is none.
+        """
+        try:
+            with open(self.model_spec_path(), 'r') as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def save_model_spec(self):
+        """
+        Stores the order of the fitted model so later runs can skip the order search.
+        """
+        arma = self.model.model_['arma']
+        coef = self.model.model_['coef']
+        spec = {
+            'order': [arma[0], arma[5], arma[1]],
+            'include_mean': 'intercept' in coef,
+            'include_drift': 'drift' in coef
+        }
+        try:
+            with open(self.model_spec_path(), 'w') as f:
+                json.dump(spec, f)
+        except (IOError, OSError) as e:
+            print(f"[ERROR] Failed to save model order: {e}")
+
+    def fit_known_order(self, spec):
+        """
+        Fits an ARIMA model with a previously selected order, skipping the order search.
+
+        Args:
+            spec (dict): Stored model specification.
+
+        Returns:
+            bool: True if the model was fitted and shows no drift on the most recent data.
+        """
+        try:
+            model = ARIMA(order=tuple(spec['order']), include_mean=spec['include_mean'], include_drift=spec['include_drift'])
+            model.fit(y=self.train, X=self.train_exog)
+        except Exception as e:
+            # A failed refit falls back to the full search, which replaces the stored order
+            print(f"[INFO] Stored model order could not be fitted ({e}), re-running the order search.")
+            return False
+
+        residuals = np.asarray(model.model_['residuals'])
+        in_sample_mse = np.nanmean(residuals ** 2)
+        tail_mse = np.nanmean(residuals[-self._DRIFT_WINDOW:] ** 2)
+        if tail_mse > (self._DRIFT_RMSE_RATIO ** 2) * in_sample_mse:
+            print("[INFO] Recent residuals drifted from the stored model order, re-running the order search.")
+            return False
+
+        self.model = model
+        return True
 
     def fit_auto_arima(self):
         """
         Fits an ARIMA model to the training data with optional exogenous variables.
+
+        The order found by the last full search for the same asset and timeframe is reused while it
+        still fits the recent data; otherwise the stepwise order search is run again.
         """
         try:
-            self.model = auto_arima(
-                self.train,
-                X=self.train_exog,
-                seasonal=False,
-                trace=False,
-                error_action='ignore',
-                suppress_warnings=True,
-                stepwise=True
-            )
+            spec = self.load_model_spec()
+            if spec is not None and self.fit_known_order(spec):
+                print(f"[INFO] ARIMA model successfully fitted with stored order {tuple(spec['order'])}.")
+                return
+
+            # statsforecast's AutoARIMA runs the stepwise order search in Numba-compiled code
+            self.model = AutoARIMA(seasonal=False, stepwise=True, approximation=False)
+            self.model.fit(y=self.train, X=self.train_exog)
+            self.save_model_spec()
             print("[INFO] ARIMA model successfully fitted.")
         except Exception as e:
             print(f"[ERROR] Failed to fit ARIMA model: {e}")
@@ -120,38 +363,35 @@ class ModelGenerator:
             steps (int): Number of future time steps to forecast.
         """
         try:
-            exogenous_columns = {
-                '365days': ['market_cap', 'volume', '5_day_MA', '25_day_MA', '100_day_MA'],
-                '90days': ['market_cap', 'volume', '9_hr_EMA', '50_hr_EMA', '12_hr_RSI']
-            }.get(timeframe, [])
+            exogenous_columns = self._EXOG.get(timeframe, ())
 
             if not exogenous_columns:
                 print(f"[ERROR] Invalid timeframe: {timeframe}")
                 return
 
-            recent_exog_data = self.train_exog[exogenous_columns].iloc[-steps:]
-
             ma_columns = [col for col in exogenous_columns if "MA" in col]
             non_ma_columns = [col for col in exogenous_columns if col not in ma_columns]
+            ma_idx = [exogenous_columns.index(col) for col in ma_columns]
+            non_ma_idx = [exogenous_columns.index(col) for col in non_ma_columns]
 
-            slopes = {col: (recent_exog_data[col].iloc[-1] - recent_exog_data[col].iloc[0]) / (steps - 1) for col in non_ma_columns}
+            recent = self.train_exog[-steps:]
+            slopes = (recent[-1, non_ma_idx] - recent[0, non_ma_idx]) / (steps - 1)
 
-            self.future_exog_data = pd.DataFrame(columns=exogenous_columns)
-            self.future_exog_data.loc[0] = recent_exog_data.iloc[-1]
+            # Every step starts from the last observed row; non-MA columns follow a linear trend
+            future = np.tile(recent[-1], (steps, 1))
+            future[:, non_ma_idx] += slopes * np.arange(steps)[:, None]
 
+            # MA columns are nudged by the previous step's spread between neighbouring averages
             for step in range(1, steps):
-                self.future_exog_data.loc[step] = self.future_exog_data.loc[0]
+                previous, current = future[step - 1], future[step]
+                for ma1, ma2 in zip(ma_idx, ma_idx[1:]):
+                    trend_direction = 1 if previous[ma1] > previous[ma2] else -1
+                    current[ma1] += trend_direction * abs(previous[ma2] - previous[ma1]) * 0.1
+                    current[ma2] += trend_direction * abs(previous[ma2] - future[0, ma2]) * 0.05
 
-                for col, slope in slopes.items():
-                    self.future_exog_data.loc[step, col] += slope * step
+            self.future_exog_data = pd.DataFrame(future, columns=exogenous_columns)
 
-                for i in range(len(ma_columns) - 1):
-                    ma1, ma2 = ma_columns[i], ma_columns[i + 1]
-                    trend_direction = 1 if self.future_exog_data.loc[step - 1, ma1] > self.future_exog_data.loc[step - 1, ma2] else -1
-                    self.future_exog_data.loc[step, ma1] += trend_direction * abs(self.future_exog_data.loc[step - 1, ma2] - self.future_exog_data.loc[step - 1, ma1]) * 0.1
-                    self.future_exog_data.loc[step, ma2] += trend_direction * abs(self.future_exog_data.loc[step - 1, ma2] - self.future_exog_data.loc[0, ma2]) * 0.05
-
-            self.forecast = self.model.predict(n_periods=steps, X=self.future_exog_data)
+            self.forecast = self.model.predict(h=steps, X=future)["mean"]
 
             print(f"[INFO] Forecast successfully generated for timeframe: {timeframe}.")
         except Exception as e:
@@ -164,39 +404,101 @@ class ModelGenerator:
 
         Args:
             steps (int): Number of future time steps forecasted.
+
+        Returns:
+            str or None: Path of the saved forecast file, or None if nothing was saved.
         """
         if self.forecast is None or self.future_exog_data is None:
             print("[WARNING] No forecast or exogenous data available to save.")
-            return
+            return None
           
         forecast_file_path = os.path.join(self.forecast_directory, f"{self.dataset_file_name}")
 
         try:
-            forecast_df = pd.DataFrame(self.forecast, columns=['price'])
-            combined_df = pd.concat([forecast_df.reset_index(drop=True), self.future_exog_data.reset_index(drop=True)], axis=1)
-
-            combined_df.to_csv(forecast_file_path, index=False)
+            # The numeric columns are written straight from the arrays, without building a DataFrame
+            exog_values = self.future_exog_data.to_numpy(np.float64)
+            columns = {
+                'timestamp': pa.array(self.forecast_timestamps, type=pa.int64()),
+                self.target: np.asarray(self.forecast, dtype=np.float64)
+            }
+            for i, col in enumerate(self.future_exog_data.columns):
+                columns[col] = exog_values[:, i]
+
+            pq.write_table(pa.table(columns), forecast_file_path, compression='zstd')
             print(f"[INFO] Forecast and all exogenous data successfully saved: {forecast_file_path}")
+            return forecast_file_path
         except Exception as e:
             print(f"[ERROR] Failed to save forecast data: {e}")
+            return None
+
+    def fit(self, timeframe, steps=30, frames=None):
+        """
+        Fits a model and forecasts future values for a given timeframe.
+
+        Args:
+            timeframe (str): Timeframe to process ('365days' or '90days').
+            steps (int): Forecast horizon in time steps of the dataset; resampled timeframes cover it in fewer bars.
+            frames (dict, optional): Engineered DataFrames already in memory, see `load_data`.
 
-    def fit(self, timeframe, steps=30):
-        """Fits a model and forecasts future values for a given timeframe."""
+        Returns:
+            str or None: Path of the saved forecast file, or None if no forecast was made.
+        """
         print(f"[INFO] Processing timeframe: {timeframe}...")
-        self.data = self.load_data(timeframe)
+        self.data = self.load_data(timeframe, frames)
+
+        if self.data is None:
+            return None
+
+        # Identical inputs give an identical forecast, so an unchanged dataset skips the fit
+        key = self.dataset_key()
+        fingerprint = self.data_fingerprint(steps)
+        fingerprints = self.load_fingerprints(timeframe)
+        previous = fingerprints.get(key)
+        if previous and previous['fingerprint'] == fingerprint:
+            forecast_file_path = self.reuse_forecast(previous['forecast'])
+            if forecast_file_path:
+                return forecast_file_path
+
+        exogenous_columns = self._EXOG.get(timeframe, ())
+
+        # Resampled series forecast fewer, longer steps over the same time horizon
+        steps = self.preprocess_data(exogenous_columns, resample_rule=self._RESAMPLE_RULES.get(timeframe), steps=steps)
+        if steps is None:
+            return None
 
-        if self.data is not None:
-            exogenous_columns = {
-                '365days': ['market_cap', 'volume', '5_day_MA', '25_day_MA', '100_day_MA'],
-                '90days': ['market_cap', 'volume', '9_hr_EMA', '50_hr_EMA', '12_hr_RSI']
-            }.get(timeframe, [])
+        self.fit_auto_arima()
+        self.forecast_future(timeframe=timeframe, steps=steps)
+        forecast_file_path = self.save_forecast(steps=steps)
 
-            self.preprocess_data(exogenous_columns)
-            self.fit_auto_arima()
-            self.forecast_future(timeframe=timeframe, steps=steps)
-            self.save_forecast(steps=steps)
+        if forecast_file_path:
+            fingerprints[key] = {'fingerprint': fingerprint, 'forecast': self.dataset_file_name}
+            self.save_fingerprints(timeframe, fingerprints)
+        return forecast_file_path
+
+    def fit_timeframes(self, timeframes=('365days', '90days'), steps=30, frames=None):
+        """
+        Fits models and forecasts future values for several timeframes in parallel.
+
+        Args:
+            timeframes (tuple): Timeframes to process.
+            steps (int): Forecast horizon in time steps of the dataset; resampled timeframes cover it in fewer bars.
+            frames (dict, optional): Engineered DataFrames already in memory, see `load_data`.
+
+        Returns:
+            list: Path of the saved forecast file (or None) for each timeframe.
+        """
+        # Each worker only receives the model columns of its own timeframe's frames
+        frames = frames or {}
+        timeframe_frames = [
+            {name: df[['timestamp', self.target, *self._EXOG.get(timeframe, ())]]
+             for name, df in frames.items() if name.endswith(timeframe)}
+            for timeframe in timeframes
+        ]
+
+        # Timeframes use separate datasets, forecasts and model orders, so each is fitted in its own process
+        with ProcessPoolExecutor(max_workers=min(len(timeframes), os.cpu_count() or 1)) as executor:
+            return list(executor.map(self.fit, timeframes, repeat(steps), timeframe_frames))
 
 if __name__ == '__main__':
     model_generator = ModelGenerator()
-    model_generator.fit(timeframe='365days', steps=30)
-    model_generator.fit(timeframe='90days', steps=30)
\ No newline at end of file
+    model_generator.fit_timeframes(timeframes=('365days', '90days'), steps=30)
\ No newline at end of file
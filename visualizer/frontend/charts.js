@@ -7,13 +7,14 @@ function formatTimestamp(timestamp) {
 function drawChart(chartData, analysisData) {
     const ctx = document.getElementById("trend-chart").getContext("2d");
 
-    if (!chartData.length || !analysisData) {
+    // chartData is columnar: one array per column, all of the same length
+    if (!chartData.timestamp || !chartData.timestamp.length || !analysisData) {
         console.error("No data or analysis available for chart rendering.");
         return;
     }
 
-    const timestamps = chartData.map(row => formatTimestamp(row.timestamp));
-    const prices = chartData.map(row => row.price);
+    const timestamps = chartData.timestamp.map(formatTimestamp);
+    const prices = chartData.price;
 
     const resistance = analysisData.resistance;
     const support = analysisData.support;
@@ -49,10 +50,11 @@ function drawChart(chartData, analysisData) {
 ];
 
     indicators.forEach(({ key, label, color, yAxisID, hidden }) => {
-        if (chartData.some(row => row[key] !== null && row[key] !== undefined)) {
+        const values = chartData[key];
+        if (values && values.some(value => value !== null && value !== undefined)) {
             datasets.push({
                 label,
-                data: chartData.map(row => row[key] ?? null),
+                data: values,
                 borderColor: color,
                 fill: false,
                 pointRadius: 0,